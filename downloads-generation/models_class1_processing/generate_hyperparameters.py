@@ -2,8 +2,8 @@
 Generate grid of hyperparameters
 """
 from __future__ import print_function
+import itertools
 from sys import stdout, stderr
-from copy import deepcopy
 from yaml import dump
 
 base_hyperparameters = dict(
@@ -24,28 +24,49 @@ grid = []
 
 
 def hyperparrameters_grid():
-    for learning_rate in [0.001]:
-        for convolutional_activation in ["tanh", "relu"]:
-            for convolutional_filters in [256, 512]:
-                for flanking_averages in [True]:
-                    for convolutional_kernel_size in [11, 13, 15, 17]:
-                        for l1 in [0.0, 1e-6]:
-                            for s in [[8], [16]]:
-                                for d in [0.3, 0.5]:
-                                    new = deepcopy(base_hyperparameters)
-                                    new["learning_rate"] = learning_rate
-                                    new["convolutional_activation"] = convolutional_activation
-                                    new["convolutional_filters"] = convolutional_filters
-                                    new["flanking_averages"] = flanking_averages
-                                    new["convolutional_kernel_size"] = convolutional_kernel_size
-                                    new["convolutional_kernel_l1_l2"] = (l1, 0.0)
-                                    new["post_convolutional_dense_layer_sizes"] = s
-                                    new["dropout_rate"] = d
-                                    yield new
+    for (
+            learning_rate,
+            convolutional_activation,
+            convolutional_filters,
+            flanking_averages,
+            convolutional_kernel_size,
+            l1,
+            s,
+            d) in itertools.product(
+                [0.001],
+                ["tanh", "relu"],
+                [256, 512],
+                [True],
+                [11, 13, 15, 17],
+                [0.0, 1e-6],
+                [[8], [16]],
+                [0.3, 0.5]):
+        yield {
+            **base_hyperparameters,
+            "learning_rate": learning_rate,
+            "convolutional_activation": convolutional_activation,
+            "convolutional_filters": convolutional_filters,
+            "flanking_averages": flanking_averages,
+            "convolutional_kernel_size": convolutional_kernel_size,
+            "convolutional_kernel_l1_l2": (l1, 0.0),
+            # product() reuses the same list objects across configs; copy
+            # so the YAML dump does not emit anchors and aliases.
+            "post_convolutional_dense_layer_sizes": list(s),
+            "dropout_rate": d,
+        }
 
 
+def grid_key(hyperparameters):
+    return tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for (key, value) in sorted(hyperparameters.items()))
+
+
+seen = set()
 for new in hyperparrameters_grid():
-    if new not in grid:
+    key = grid_key(new)
+    if key not in seen:
+        seen.add(key)
         grid.append(new)
 
 print("Hyperparameters grid size: %d" % len(grid), file=stderr)
@@ -30,9 +30,6 @@ def run():
 
     alleles = pandas.Series(predictor.supported_alleles)
 
-    # Clear the file
-    pandas.DataFrame(columns=alleles).to_csv(args.out, index=True)
-
     (min_length, max_length) = predictor.supported_peptide_lengths
 
     peptides_per_length = int(
@@ -40,26 +37,29 @@ def run():
 
     peptides_written = 0
     i = 0
-    while peptides_written < args.num_peptides:
-        print("Chunk %d / %d" % (
-            i + 1, math.ceil(args.num_peptides / args.chunksize)))
-        start = time.time()
-        peptides = []
-        for l in range(8, 16):
-            peptides.extend(random_peptides(peptides_per_length, length=l))
-
-        peptides = pandas.Series(peptides).sample(
-            n=min(args.chunksize, args.num_peptides - peptides_written)).values
-        encodable_peptides = mhcflurry.encodable_sequences.EncodableSequences.create(
-            peptides)
-        df = pandas.DataFrame(index=peptides)
-        for allele in alleles:
-            df[allele] = predictor.predict(encodable_peptides, allele=allele)
-        df.to_csv(
-            args.out, index=True, mode='a', header=False, float_format='%.1f')
-        print("Wrote: %s  [%0.2f sec]" % (args.out, time.time() - start))
-        i += 1
-        peptides_written += len(peptides)
+    with open(args.out, "w") as fd:
+        # Header only; chunks are appended below without one.
+        pandas.DataFrame(columns=alleles).to_csv(fd, index=True)
+        while peptides_written < args.num_peptides:
+            print("Chunk %d / %d" % (
+                i + 1, math.ceil(args.num_peptides / args.chunksize)))
+            start = time.time()
+            peptides = []
+            for l in range(8, 16):
+                peptides.extend(random_peptides(peptides_per_length, length=l))
+
+            peptides = pandas.Series(peptides).sample(
+                n=min(args.chunksize, args.num_peptides - peptides_written)).values
+            encodable_peptides = mhcflurry.encodable_sequences.EncodableSequences.create(
+                peptides)
+            df = pandas.DataFrame(index=peptides)
+            for allele in alleles:
+                df[allele] = predictor.predict(encodable_peptides, allele=allele)
+            df.to_csv(fd, index=True, header=False, float_format='%.1f')
+            fd.flush()
+            print("Wrote: %s  [%0.2f sec]" % (args.out, time.time() - start))
+            i += 1
+            peptides_written += len(peptides)
 
     print("Done.")
 
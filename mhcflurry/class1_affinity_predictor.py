@@ -819,7 +819,11 @@ class Class1AffinityPredictor(object):
         list of `Class1NeuralNetwork`
         """
 
-        alleles = pandas.Series(alleles).map(mhcnames.normalize_allele_name)
+        alleles = pandas.Series(alleles)
+        alleles = alleles.map(
+            dict(
+                (allele, mhcnames.normalize_allele_name(allele))
+                for allele in alleles.unique()))
         allele_encoding = AlleleEncoding(
             alleles,
             borrow_from=self.master_allele_encoding)
@@ -1065,8 +1069,11 @@ class Class1AffinityPredictor(object):
             unique_alleles = [normalized_allele]
         else:
             df["allele"] = numpy.array(alleles)
+            # Normalize each distinct allele name once rather than per row.
             df["normalized_allele"] = df.allele.map(
-                mhcnames.normalize_allele_name)
+                dict(
+                    (allele, mhcnames.normalize_allele_name(allele))
+                    for allele in df.allele.unique()))
             unique_alleles = df.normalized_allele.unique()
 
         if len(df) == 0:
@@ -1237,10 +1244,10 @@ class Class1AffinityPredictor(object):
         df["prediction"] = numpy.exp(log_centers)
 
         if include_confidence_intervals:
-            df["prediction_low"] = numpy.exp(
-                numpy.nanpercentile(logs, 5.0, axis=1))
-            df["prediction_high"] = numpy.exp(
-                numpy.nanpercentile(logs, 95.0, axis=1))
+            (log_lows, log_highs) = numpy.nanpercentile(
+                logs, [5.0, 95.0], axis=1)
+            df["prediction_low"] = numpy.exp(log_lows)
+            df["prediction_high"] = numpy.exp(log_highs)
 
         if include_individual_model_predictions:
             for i in range(num_pan_models):
@@ -752,7 +752,7 @@ class Class1NeuralNetwork(object):
         num_random_negatives = random_negatives_planner.get_total_count()
 
         y_values = from_ic50(numpy.array(affinities, copy=False))
-        assert numpy.isnan(y_values).sum() == 0, y_values
+        assert not numpy.isnan(y_values).any(), y_values
         if inequalities is not None:
             # Reverse inequalities because from_ic50() flips the direction
             # (i.e. lower affinity results in higher y values).
@@ -781,7 +781,7 @@ class Class1NeuralNetwork(object):
         if shuffle_permutation is None:
             shuffle_permutation = numpy.random.permutation(len(y_values))
         y_values = y_values[shuffle_permutation]
-        assert numpy.isnan(y_values).sum() == 0, y_values
+        assert not numpy.isnan(y_values).any(), y_values
         peptide_encoding = peptide_encoding[shuffle_permutation]
         adjusted_inequalities = adjusted_inequalities[shuffle_permutation]
         for key in x_dict_without_random_negatives:
@@ -865,7 +865,7 @@ class Class1NeuralNetwork(object):
                 ]),
             }
             adjusted_inequalities_with_random_negatives = None
-        assert numpy.isnan(y_dict_with_random_negatives['output']).sum() == 0, (
+        assert not numpy.isnan(y_dict_with_random_negatives['output']).any(), (
             y_dict_with_random_negatives)
         if sample_weights is not None:
             sample_weights_with_random_negatives = numpy.concatenate([
@@ -160,7 +160,7 @@ class Class1ProcessingNeuralNetwork(object):
         if shuffle_permutation is None:
             shuffle_permutation = numpy.random.permutation(len(targets))
         targets = targets[shuffle_permutation]
-        assert numpy.isnan(targets).sum() == 0, targets
+        assert not numpy.isnan(targets).any(), targets
         if sample_weights is not None:
             sample_weights = numpy.array(sample_weights)[shuffle_permutation]
         for key in list(x_dict):
@@ -26,10 +26,11 @@ def robust_mean(log_values):
         # Too few values to use robust mean.
         return numpy.nanmean(log_values, axis=1)
     without_nans = numpy.nan_to_num(log_values)  # replace nan with 0
+    (low, high) = numpy.nanpercentile(log_values, [25, 75], axis=1)
     mask = (
         (~numpy.isnan(log_values)) &
-        (without_nans <= numpy.nanpercentile(log_values, 75, axis=1).reshape((-1, 1))) &
-        (without_nans >= numpy.nanpercentile(log_values, 25, axis=1).reshape((-1, 1))))
+        (without_nans <= high.reshape((-1, 1))) &
+        (without_nans >= low.reshape((-1, 1))))
     return (without_nans * mask.astype(float)).sum(1) / mask.sum(1)
 
 
@@ -422,12 +422,10 @@ def subselect_df_held_out(df, recriprocal_held_out_fraction=10, seed=0):
         random_state=seed)
 
     # Stratify by both allele and binder vs. nonbinder.
-    df["key"] = [
-        "%s_%s" % (
-            row.allele,
-            "binder" if row.measurement_value <= 500 else "nonbinder")
-        for (_, row) in df.iterrows()
-    ]
+    df["key"] = df.allele + "_" + (df.measurement_value <= 500).map({
+        True: "binder",
+        False: "nonbinder",
+    })
 
     (train, test) = next(kf.split(df, df.key))
     selected_allele_peptides = df.iloc[train].allele_peptide.unique()
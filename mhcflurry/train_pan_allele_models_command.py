@@ -168,9 +168,10 @@ def assign_folds(df, num_folds, held_out_fraction, held_out_max):
         result_df["fold_%d" % fold] = True
         for (allele, sub_df) in df.groupby("allele"):
             medians = sub_df.groupby("peptide").measurement_value.median()
+            median_of_medians = medians.median()
 
-            low_peptides = medians[medians < medians.median()].index.values
-            high_peptides = medians[medians >= medians.median()].index.values
+            low_peptides = medians[medians < median_of_medians].index.values
+            high_peptides = medians[medians >= median_of_medians].index.values
 
             held_out_count = int(
                 min(len(medians) * held_out_fraction, held_out_max))